@@ -8,7 +8,6 @@ from textual.app import App
 
 from .. import __version__
 from ..data import load_config
-from ..screens import Main
 from ..utility.advertising import APPLICATION_TITLE, PACKAGE_NAME
 
 
@@ -32,6 +31,12 @@ class MarkdownViewer(App[None]):
 
     def on_mount(self) -> None:
         """Set up the application after the DOM is ready."""
+        # The main screen pulls in all of the application's widgets, so it's
+        # only imported once it's needed; this keeps --help and --version
+        # snappy.
+        # pylint:disable=import-outside-toplevel
+        from ..screens import Main
+
         self.push_screen(Main(" ".join(self._args.file) if self._args.file else None))
 
     def action_visit(self, url: str) -> None:
@@ -26,6 +26,7 @@ class Config:
     """Should navigation be docked to the left side of the screen?"""
 
 
+@lru_cache(maxsize=None)
 def config_file() -> Path:
     """Get the path to the configuration file.
 
@@ -34,7 +35,8 @@ def config_file() -> Path:
 
     Note:
         As a side-effect, the configuration directory will be created if it
-        does not exist.
+        does not exist. The location is cached, so the directory is only
+        checked for and created on the first call.
     """
     (config_dir := xdg_config_home() / ORGANISATION_NAME / PACKAGE_NAME).mkdir(
         parents=True, exist_ok=True
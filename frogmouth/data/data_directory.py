@@ -1,5 +1,6 @@
 """Provides a function for working out the data directory location."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from xdg import xdg_data_home
@@ -7,6 +8,7 @@ from xdg import xdg_data_home
 from ..utility.advertising import ORGANISATION_NAME, PACKAGE_NAME
 
 
+@lru_cache(maxsize=None)
 def data_directory() -> Path:
     """Get the location of the data directory.
 
@@ -15,6 +17,8 @@ def data_directory() -> Path:
 
     Note:
         As a side effect, if the directory doesn't exist it will be created.
+        The location is cached, so the directory is only checked for and
+        created on the first call.
     """
     (target_directory := xdg_data_home() / ORGANISATION_NAME / PACKAGE_NAME).mkdir(
         parents=True, exist_ok=True
@@ -71,17 +71,19 @@ class InputDialog(ModalScreen[str]):
 
     def compose(self) -> ComposeResult:
         """Compose the child widgets."""
+        # pylint:disable=attribute-defined-outside-init
+        self._input = Input(self._initial or "")
         with Vertical():
             with Vertical(id="input"):
                 yield Label(self._prompt)
-                yield Input(self._initial or "")
+                yield self._input
             with Horizontal(id="buttons"):
                 yield Button("OK", id="ok", variant="primary")
                 yield Button("Cancel", id="cancel")
 
     def on_mount(self) -> None:
         """Set up the dialog once the DOM is ready."""
-        self.query_one(Input).focus()
+        self._input.focus()
 
     @on(Button.Pressed, "#cancel")
     def cancel_input(self) -> None:
@@ -92,5 +94,5 @@ class InputDialog(ModalScreen[str]):
     @on(Button.Pressed, "#ok")
     def accept_input(self) -> None:
         """Accept and return the input."""
-        if value := self.query_one(Input).value.strip():
+        if value := self._input.value.strip():
             self.dismiss(value)
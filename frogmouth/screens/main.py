@@ -2,23 +2,28 @@
 
 from __future__ import annotations
 
+from asyncio import get_running_loop
 from functools import partial
-from pathlib import Path
-from typing import Awaitable, Callable
+from pathlib import Path, PurePosixPath
+from typing import Any, Awaitable, Callable
 from webbrowser import open as open_url
 
 from httpx import URL
+from textual import on, work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
 from textual.events import Paste
 from textual.screen import Screen
 from textual.widgets import Footer, Markdown
+from textual.worker import get_current_worker
+from typing_extensions import Final
 
 from .. import __version__
 from ..data import load_config, load_history, save_config, save_history
 from ..dialogs import ErrorDialog, HelpDialog, InformationDialog, InputDialog
 from ..utility import (
+    DeferredSave,
     build_raw_bitbucket_url,
     build_raw_codeberg_url,
     build_raw_github_url,
@@ -37,6 +42,30 @@ from ..utility.advertising import (
 from ..widgets import Navigation, Omnibox, Viewer
 from ..widgets.navigation_panes import Bookmarks, History, LocalFiles
 
+_FORGES: Final[
+    dict[
+        type[Omnibox.ForgeCommand],
+        tuple[str, Callable[[str, str, str | None, str | None], Awaitable[URL | None]]],
+    ]
+] = {
+    Omnibox.GitHubCommand: ("GitHub", build_raw_github_url),
+    Omnibox.GitLabCommand: ("GitLab", build_raw_gitlab_url),
+    Omnibox.BitBucketCommand: ("BitBucket", build_raw_bitbucket_url),
+    Omnibox.CodebergCommand: ("Codeberg", build_raw_codeberg_url),
+}
+"""The display name and URL builder for each of the forge commands."""
+
+_ABOUT_TITLE: Final[str] = f"{APPLICATION_TITLE} [b dim]v{__version__}"
+"""The title for the about dialog."""
+
+_ABOUT_BODY: Final[str] = (
+    f"Built with [@click=app.visit('{TEXTUAL_URL}')]Textual[/] "
+    f"by [@click=app.visit('{ORGANISATION_URL}')]{ORGANISATION_TITLE}[/].\n\n"
+    f"[@click=app.visit('https://github.com/{ORGANISATION_NAME}/{PACKAGE_NAME}')]"
+    f"https://github.com/{ORGANISATION_NAME}/{PACKAGE_NAME}[/]"
+)
+"""The body of the about dialog."""
+
 
 class Main(Screen[None]):  # pylint:disable=too-many-public-methods
     """The main screen for the application."""
@@ -90,6 +119,9 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
     ]
     """The keyboard bindings for the main screen."""
 
+    HISTORY_SAVE_DELAY: Final[float] = 0.5
+    """How long to wait for history to settle before saving it, in seconds."""
+
     def __init__(self, initial_location: str | None = None) -> None:
         """Initialise the main screen.
 
@@ -98,6 +130,12 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         """
         super().__init__()
         self._initial_location = initial_location
+        self._pending_updates: dict[Callable[[Any], None], Any] = {}
+        """Updates waiting for the next refresh, keyed by what they update."""
+        self._history_saver: DeferredSave[list[Path | URL]] = DeferredSave(
+            self, save_history, self.HISTORY_SAVE_DELAY
+        )
+        """Saves the history once it has settled down."""
 
     def compose(self) -> ComposeResult:
         """Compose the main screen.
@@ -105,10 +143,14 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         Returns:
             The result of composing the screen.
         """
-        yield Omnibox(classes="focusable")
+        # pylint:disable=attribute-defined-outside-init
+        self._omnibox = Omnibox(classes="focusable")
+        self._navigation = Navigation()
+        self._viewer = Viewer(classes="focusable")
+        yield self._omnibox
         with Horizontal():
-            yield Navigation()
-            yield Viewer(classes="focusable")
+            yield self._navigation
+            yield self._viewer
         yield Footer()
 
     def visit(self, location: Path | URL, remember: bool = True) -> None:
@@ -122,7 +164,7 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         # locally in the filesystem or out on the web...
         if maybe_markdown(location):
             # ...attempt to visit it in the viewer.
-            self.query_one(Viewer).visit(location, remember)
+            self._viewer.visit(location, remember)
         elif isinstance(location, Path):
             # So, it's not Markdown, but it *is* a Path of some sort. If the
             # resource seems to exist...
@@ -144,7 +186,7 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
             # the operating system anyway.
             open_url(str(location), new=2, autoraise=True)
 
-    async def on_mount(self) -> None:
+    def on_mount(self) -> None:
         """Set up the main screen once the DOM is ready."""
 
         # Currently Textual's Markdown can steal focus, which gets confusing
@@ -152,11 +194,28 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         # allowing the content to get focus.
         #
         # https://github.com/Textualize/textual/issues/2380
-        self.query_one(Markdown).can_focus_children = False
+        self._viewer.document.can_focus_children = False
 
+        # Loading the history means a trip to storage, so do that in the
+        # background and carry on starting up once it's available.
+        self._load_history()
+
+    @work(exclusive=True)
+    async def _load_history(self) -> None:
+        """Load any saved history in the background."""
+        await self._history_loaded(
+            await get_running_loop().run_in_executor(None, load_history)
+        )
+
+    async def _history_loaded(self, history: list[Path | URL]) -> None:
+        """Finish starting up once the history has been loaded.
+
+        Args:
+            history: The history that was loaded.
+        """
         # Load up any history that might be saved.
-        if history := load_history():
-            self.query_one(Viewer).load_history(history)
+        if history:
+            self._viewer.load_history(history)
 
         # If we've not been tasked to start up looking at a very specific
         # location (in other words if no location was passed on the command
@@ -164,17 +223,17 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         if self._initial_location is None and history:
             # ...start up revisiting the last location the user was looking
             # at.
-            self.query_one(Viewer).visit(history[-1], remember=False)
-            self.query_one(Omnibox).value = str(history[-1])
+            self._viewer.visit(history[-1], remember=False)
+            self._omnibox.value = str(history[-1])
         elif self._initial_location is not None:
             # Seems there is an initial location; so let's start up looking
             # at that.
-            (omnibox := self.query_one(Omnibox)).value = self._initial_location
-            await omnibox.action_submit()
+            self._omnibox.value = self._initial_location
+            await self._omnibox.action_submit()
 
     def on_navigation_hidden(self) -> None:
         """React to the navigation sidebar being hidden."""
-        self.query_one(Viewer).focus()
+        self._viewer.focus()
 
     def on_omnibox_local_view_command(self, event: Omnibox.LocalViewCommand) -> None:
         """Handle the omnibox asking us to view a particular file.
@@ -219,25 +278,23 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
                 ErrorDialog("Not a directory", f"{event.target} is not a directory.")
             )
         else:
-            self.query_one(Navigation).jump_to_local_files(event.target)
+            self._navigation.jump_to_local_files(event.target)
 
     def on_omnibox_history_command(self) -> None:
         """Handle being asked to view the history."""
         self.action_history()
 
-    async def _from_forge(
-        self,
-        forge: str,
-        event: Omnibox.ForgeCommand,
-        builder: Callable[[str, str, str | None, str | None], Awaitable[URL | None]],
-    ) -> None:
-        """Build a URL for getting a file from a given forge.
+    @on(Omnibox.GitHubCommand)
+    @on(Omnibox.GitLabCommand)
+    @on(Omnibox.BitBucketCommand)
+    @on(Omnibox.CodebergCommand)
+    async def _from_forge(self, event: Omnibox.ForgeCommand) -> None:
+        """Handle a forge file shortcut command.
 
         Args:
-            forge: The display name of the forge.
-            event: The event that contains the request information for the file.
-            builder: The function that builds the URL.
+            event: The forge shortcut command event to handle.
         """
+        forge, builder = _FORGES[type(event)]
         if url := await builder(
             event.owner, event.repository, event.branch, event.desired_file
         ):
@@ -251,40 +308,6 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
                 )
             )
 
-    async def on_omnibox_git_hub_command(self, event: Omnibox.GitHubCommand) -> None:
-        """Handle a GitHub file shortcut command.
-
-        Args:
-            event: The GitHub shortcut command event to handle.
-        """
-        await self._from_forge("GitHub", event, build_raw_github_url)
-
-    async def on_omnibox_git_lab_command(self, event: Omnibox.GitLabCommand) -> None:
-        """Handle a GitLab file shortcut command.
-
-        Args:
-            event: The GitLab shortcut command event to handle.
-        """
-        await self._from_forge("GitLab", event, build_raw_gitlab_url)
-
-    async def on_omnibox_bit_bucket_command(
-        self, event: Omnibox.BitBucketCommand
-    ) -> None:
-        """Handle a BitBucket shortcut command.
-
-        Args:
-            event: The BitBucket shortcut command event to handle.
-        """
-        await self._from_forge("BitBucket", event, build_raw_bitbucket_url)
-
-    async def on_omnibox_codeberg_command(self, event: Omnibox.CodebergCommand) -> None:
-        """Handle a Codeberg shortcut command.
-
-        Args:
-            event: The Codeberg shortcut command event to handle.
-        """
-        await self._from_forge("Codeberg", event, build_raw_codeberg_url)
-
     def on_omnibox_about_command(self) -> None:
         """Handle being asked to show the about dialog."""
         self.action_about()
@@ -311,9 +334,7 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         Args:
             event: The event to handle.
         """
-        self.visit(
-            event.location, remember=event.location != self.query_one(Viewer).location
-        )
+        self.visit(event.location, remember=event.location != self._viewer.location)
 
     def on_history_delete(self, event: History.Delete) -> None:
         """Handle a request to delete an item from history.
@@ -321,11 +342,11 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         Args:
             event: The event to handle.
         """
-        self.query_one(Viewer).delete_history(event.history_id)
+        self._viewer.delete_history(event.history_id)
 
     def on_history_clear(self) -> None:
         """handle a request to clear down all of history."""
-        self.query_one(Viewer).clear_history()
+        self._viewer.clear_history()
 
     def on_bookmarks_goto(self, event: Bookmarks.Goto) -> None:
         """Handle a request to go to a bookmark.
@@ -341,13 +362,17 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         Args:
             event: The location change event.
         """
-        # Update the omnibox with whatever is appropriate for the new location.
-        self.query_one(Omnibox).visiting = (
-            str(event.viewer.location) if event.viewer.location is not None else ""
-        )
+        # Update the omnibox with whatever is appropriate for the new
+        # location. Note that visiting is reactive, so setting it to the
+        # value it already has won't cause any extra work.
+        location = event.viewer.location
+        self._omnibox.visiting = "" if location is None else str(location)
         # Having safely arrived at a new location, that implies that we want
         # to focus on the viewer.
-        self.query_one(Viewer).focus()
+        self._viewer.focus()
+        # Arriving at the location may also have added to the history.
+        if event.history_updated:
+            self._history_updated(event.viewer)
 
     def on_viewer_history_updated(self, event: Viewer.HistoryUpdated) -> None:
         """Handle the viewer updating the history.
@@ -355,8 +380,49 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         Args:
             event: The history update event.
         """
-        self.query_one(Navigation).history.update_from(event.viewer.history.locations)
-        save_history(event.viewer.history.locations)
+        self._history_updated(event.viewer)
+
+    def _history_updated(self, viewer: Viewer) -> None:
+        """React to the history of the given viewer being updated.
+
+        Args:
+            viewer: The viewer whose history was updated.
+        """
+        self._update_after_refresh(
+            self._navigation.history.update_from, viewer.history.locations
+        )
+        # Rather than write the history out every time it changes, wait for
+        # it to settle down and then save the latest version.
+        self._history_saver.update(viewer.history.locations)
+
+    def _update_after_refresh(self, update: Callable[[Any], None], value: Any) -> None:
+        """Apply an update after the next refresh.
+
+        Args:
+            update: The function that applies the update.
+            value: The value to apply.
+
+        Note:
+            Updates can arrive faster than the display refreshes, and only
+            the most recent one matters; so any value already waiting for
+            the same update is replaced rather than applied as well.
+        """
+        if update not in self._pending_updates:
+            self.call_after_refresh(self._apply_update, update)
+        self._pending_updates[update] = value
+
+    def _apply_update(self, update: Callable[[Any], None]) -> None:
+        """Apply the most recent value waiting for the given update.
+
+        Args:
+            update: The function that applies the update.
+        """
+        update(self._pending_updates.pop(update))
+
+    def on_unmount(self) -> None:
+        """Tidy up when the main screen is removed."""
+        # Make sure we don't lose any history that's waiting to be saved.
+        self._history_saver.flush()
 
     def on_markdown_table_of_contents_updated(
         self, event: Markdown.TableOfContentsUpdated
@@ -368,7 +434,9 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         """
         # We don't handle this, the navigation pane does. Bounce the event
         # over there.
-        self.query_one(Navigation).table_of_contents.on_table_of_contents_updated(event)
+        self._update_after_refresh(
+            self._navigation.table_of_contents.on_table_of_contents_updated, event
+        )
 
     def on_markdown_table_of_contents_selected(
         self, event: Markdown.TableOfContentsSelected
@@ -378,7 +446,7 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         Args:
             event: The table of contents selection event to handle.
         """
-        self.query_one(Viewer).scroll_to_block(event.block_id)
+        self._viewer.scroll_to_block(event.block_id)
 
     def on_markdown_link_clicked(self, event: Markdown.LinkClicked) -> None:
         """Handle a link being clicked in the Markdown document.
@@ -388,9 +456,17 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         """
         # We'll be using the current location to help work out some relative
         # things.
-        current_location = self.query_one(Viewer).location
+        current_location = self._viewer.location
+        # If the href starts with a # and the remains of it can be satisfied
+        # as an anchor within the document of the Markdown...
+        if event.href.startswith("#") and event.markdown.goto_anchor(event.href[1:]):
+            # ...we should have scrolled to about the right spot in the
+            # document so we don't need to do anything else. This is checked
+            # first as it's common and cheap, and needs neither a trip to
+            # the filesystem nor a reload of a remote document.
+            pass
         # If the link we're to handle obviously looks like URL...
-        if is_likely_url(event.href):
+        elif is_likely_url(event.href):
             # ...handle it as such. No point in trying to do anything else.
             self.visit(URL(event.href))
         elif isinstance(current_location, URL):
@@ -411,12 +487,6 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
             # document we found it exists in the local filesystem, so let's
             # assume that's what we're supposed to handle.
             self.visit(local_file)
-        elif event.href.startswith("#") and event.markdown.goto_anchor(event.href[1:]):
-            # The href started with a # and the remains of it were satisfied
-            # as an anchor within the document of the Markdown. We should
-            # have scrolled to about the right spot in the document so we
-            # don't need to do anything else.
-            pass
         else:
             # Yeah, not sure *what* this link is. Rather than silently fail,
             # let's let the user know we don't know how to process this.
@@ -437,12 +507,30 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         of a local file (later I may add URL support too). The main purpose
         of this is to handle drag/drop into the terminal.
         """
-        if (candidate_file := Path(event.text)).exists():
-            self.visit(candidate_file)
+        # Before going near the filesystem, weed out anything that can't
+        # sensibly be the name of a single local file.
+        text = event.text
+        if not text or len(text) > 4096 or "\n" in text or "://" in text:
+            return
+        self._probe_paste(Path(text))
+
+    @work(thread=True, exclusive=True, group="probe_paste")
+    def _probe_paste(self, candidate_file: Path) -> None:
+        """Visit a pasted path if it names something in the filesystem.
+
+        Args:
+            candidate_file: The path that was pasted.
+        """
+        try:
+            exists = candidate_file.exists()
+        except (OSError, ValueError):
+            exists = False
+        if exists and not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self.visit, candidate_file)
 
     def action_navigation(self) -> None:
         """Toggle the availability of the navigation sidebar."""
-        self.query_one(Navigation).toggle()
+        self._navigation.toggle()
 
     def action_escape(self) -> None:
         """Process the escape key."""
@@ -452,43 +540,43 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
         # the application. The idea being that folk who use this often want
         # to build up muscle memory on the keyboard will know to camp on the
         # escape key until they get to where they want to be.
-        if (omnibox := self.query_one(Omnibox)).has_focus:
-            if omnibox.value:
-                omnibox.value = ""
+        if self._omnibox.has_focus:
+            if self._omnibox.value:
+                self._omnibox.value = ""
             else:
                 self.app.exit()
         else:
-            if self.query("Navigation:focus-within"):
-                self.query_one(Navigation).popped_out = False
-            omnibox.focus()
+            if self._navigation.has_pseudo_class("focus-within"):
+                self._navigation.popped_out = False
+            self._omnibox.focus()
 
     def action_omnibox(self) -> None:
         """Jump to the omnibox."""
-        self.query_one(Omnibox).focus()
+        self._omnibox.focus()
 
     def action_table_of_contents(self) -> None:
         """Display and focus the table of contents pane."""
-        self.query_one(Navigation).jump_to_contents()
+        self._navigation.jump_to_contents()
 
     def action_local_files(self) -> None:
         """Display and focus the local files selection pane."""
-        self.query_one(Navigation).jump_to_local_files()
+        self._navigation.jump_to_local_files()
 
     def action_bookmarks(self) -> None:
         """Display and focus the bookmarks selection pane."""
-        self.query_one(Navigation).jump_to_bookmarks()
+        self._navigation.jump_to_bookmarks()
 
     def action_history(self) -> None:
         """Display and focus the history pane."""
-        self.query_one(Navigation).jump_to_history()
+        self._navigation.jump_to_history()
 
     def action_backward(self) -> None:
         """Go backward in the history."""
-        self.query_one(Viewer).back()
+        self._viewer.back()
 
     def action_forward(self) -> None:
         """Go forward in the history."""
-        self.query_one(Viewer).forward()
+        self._viewer.forward()
 
     def action_help(self) -> None:
         """Show the help."""
@@ -496,15 +584,7 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
 
     def action_about(self) -> None:
         """Show the about dialog."""
-        self.app.push_screen(
-            InformationDialog(
-                f"{APPLICATION_TITLE} [b dim]v{__version__}",
-                f"Built with [@click=app.visit('{TEXTUAL_URL}')]Textual[/] "
-                f"by [@click=app.visit('{ORGANISATION_URL}')]{ORGANISATION_TITLE}[/].\n\n"
-                f"[@click=app.visit('https://github.com/{ORGANISATION_NAME}/{PACKAGE_NAME}')]"
-                f"https://github.com/{ORGANISATION_NAME}/{PACKAGE_NAME}[/]",
-            )
-        )
+        self.app.push_screen(InformationDialog(_ABOUT_TITLE, _ABOUT_BODY))
 
     def add_bookmark(self, location: Path | URL, bookmark: str) -> None:
         """Handle adding the bookmark.
@@ -513,12 +593,12 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
             location: The location to bookmark.
             bookmark: The bookmark to add.
         """
-        self.query_one(Navigation).bookmarks.add_bookmark(bookmark, location)
+        self._navigation.bookmarks.add_bookmark(bookmark, location)
 
     def action_bookmark_this(self) -> None:
         """Add a bookmark for the currently-viewed file."""
 
-        location = self.query_one(Viewer).location
+        location = self._viewer.location
 
         # Only allow bookmarking if we're actually viewing something that
         # can be bookmarked.
@@ -532,8 +612,11 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
             return
 
         # To make a bookmark, we need a title and a location. We've got a
-        # location; let's make the filename the default title.
-        title = (location if isinstance(location, Path) else Path(location.path)).name
+        # location; let's make the filename the default title. Note that the
+        # path of a URL is always POSIX-style, whatever we're running on.
+        title = (
+            location if isinstance(location, Path) else PurePosixPath(location.path)
+        ).name
 
         # Give the user a chance to edit the title.
         self.app.push_screen(
@@ -551,4 +634,4 @@ class Main(Screen[None]):  # pylint:disable=too-many-public-methods
 
     def action_reload(self) -> None:
         """Reload the current document."""
-        self.query_one(Viewer).reload()
+        self._viewer.reload()
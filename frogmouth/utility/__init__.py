@@ -1,5 +1,6 @@
 """General utility and support code."""
 
+from .deferred_save import DeferredSave
 from .forge import (
     build_raw_bitbucket_url,
     build_raw_codeberg_url,
@@ -9,6 +10,7 @@ from .forge import (
 from .type_tests import is_likely_url, maybe_markdown
 
 __all__ = [
+    "DeferredSave",
     "build_raw_bitbucket_url",
     "build_raw_codeberg_url",
     "build_raw_github_url",
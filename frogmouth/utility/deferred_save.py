@@ -0,0 +1,95 @@
+"""Provides a helper for saving data once it has settled down."""
+
+from __future__ import annotations
+
+from functools import partial
+from threading import Lock
+from typing import Callable, Generic, TypeVar
+
+from textual.dom import DOMNode
+from textual.timer import Timer
+
+SaveT = TypeVar("SaveT")
+"""The type of the data being saved."""
+
+
+class DeferredSave(Generic[SaveT]):
+    """Saves data in the background once it stops changing.
+
+    Rather than write data out every time it changes, hand each new version
+    to `update`; once no new version has turned up for a short while, the
+    latest one is saved in a background thread. Call `flush` when the owner
+    is going away to make sure the latest version is on storage.
+    """
+
+    def __init__(
+        self, owner: DOMNode, save: Callable[[SaveT], None], delay: float
+    ) -> None:
+        """Initialise the deferred save.
+
+        Args:
+            owner: The owner of the data, used for timers and workers.
+            save: The function that saves the data.
+            delay: How long to wait for the data to settle, in seconds.
+        """
+        self._owner = owner
+        """The owner of the data being saved."""
+        self._save = save
+        """The function that saves the data."""
+        self._delay = delay
+        """How long to wait for the data to settle, in seconds."""
+        self._timer: Timer | None = None
+        """The timer for the pending save, if there is one."""
+        self._latest: tuple[int, SaveT] | None = None
+        """The number and content of the most recent version of the data."""
+        self._saved_version = 0
+        """The number of the version of the data that was last saved."""
+        self._lock = Lock()
+        """Lock that ensures only one save happens at a time."""
+
+    def update(self, data: SaveT) -> None:
+        """Take a new version of the data, to save once it settles down.
+
+        Args:
+            data: The new version of the data.
+        """
+        version = 1 if self._latest is None else self._latest[0] + 1
+        self._latest = (version, data)
+        if self._timer is not None:
+            self._timer.stop()
+        self._timer = self._owner.set_timer(self._delay, self._settled)
+
+    def _settled(self) -> None:
+        """Save the data in the background now it has settled down."""
+        self._timer = None
+        if self._latest is not None:
+            self._owner.run_worker(
+                partial(self._write, *self._latest),
+                thread=True,
+                group="deferred_save",
+            )
+
+    def _write(self, version: int, data: SaveT) -> None:
+        """Write the given version of the data, unless it's out of date.
+
+        Args:
+            version: The number of the version of the data.
+            data: The data to write.
+        """
+        with self._lock:
+            if version > self._saved_version:
+                self._save(data)
+                self._saved_version = version
+
+    def flush(self) -> None:
+        """Save the latest version of the data there and then, if needed.
+
+        Note:
+            If a background save is underway this waits for it to finish;
+            if one has yet to start, it will find it has nothing to do.
+        """
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if self._latest is not None:
+            self._write(*self._latest)
@@ -31,7 +31,9 @@ async def build_raw_forge_url(
     target.
     """
     desired_file = desired_file or "README.md"
-    async with AsyncClient() as client:
+    async with AsyncClient(
+        follow_redirects=True, headers={"user-agent": USER_AGENT}
+    ) as client:
         for test_branch in (branch,) if branch else ("main", "master"):
             url = url_format.format(
                 owner=owner,
@@ -40,11 +42,7 @@ async def build_raw_forge_url(
                 file=desired_file,
             )
             try:
-                response = await client.head(
-                    url,
-                    follow_redirects=True,
-                    headers={"user-agent": USER_AGENT},
-                )
+                response = await client.head(url)
             except RequestError:
                 # We've failed to even make the request, there's no point in
                 # trying to build anything here.
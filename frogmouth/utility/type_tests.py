@@ -1,7 +1,10 @@
 """Support code for testing files for their potential type."""
 
-from functools import singledispatch
+from functools import lru_cache
+from os.path import splitext
 from pathlib import Path
+from re import IGNORECASE
+from re import compile as compile_regexp
 from typing import Any
 
 from httpx import URL
@@ -9,7 +12,19 @@ from httpx import URL
 from ..data.config import load_config
 
 
-@singledispatch
+@lru_cache(maxsize=4096)
+def _maybe_markdown_name(name: str) -> bool:
+    """Does the given name look like the name of a Markdown file?
+
+    Args:
+        name: The name to test.
+
+    Returns:
+        `True` if the name has a Markdown extension, `False` if not.
+    """
+    return splitext(name)[1].lower() in load_config().markdown_extensions
+
+
 def maybe_markdown(resource: Any) -> bool:
     """Does the given resource look like it's a Markdown file?
 
@@ -18,24 +33,22 @@ def maybe_markdown(resource: Any) -> bool:
 
     Returns:
         `True` if the resources looks like a Markdown file, `False` if not.
+
+    Note:
+        The results of testing names are cached, so any change to the
+        configured Markdown extensions will only be seen on the next run.
     """
-    del resource
+    if isinstance(resource, str):
+        return _maybe_markdown_name(resource)
+    if isinstance(resource, Path):
+        return _maybe_markdown_name(resource.name)
+    if isinstance(resource, URL):
+        return _maybe_markdown_name(resource.path)
     return False
 
 
-@maybe_markdown.register
-def _(resource: Path) -> bool:
-    return resource.suffix.lower() in load_config().markdown_extensions
-
-
-@maybe_markdown.register
-def _(resource: str) -> bool:
-    return maybe_markdown(Path(resource))
-
-
-@maybe_markdown.register
-def _(resource: URL) -> bool:
-    return maybe_markdown(resource.path)
+_LIKELY_URL = compile_regexp(r"^https?://[^/\s]", IGNORECASE)
+"""Regular expression for matching something that looks like a web URL."""
 
 
 def is_likely_url(candidate: str) -> bool:
@@ -47,6 +60,4 @@ def is_likely_url(candidate: str) -> bool:
     Returns:
         `True` if the string is likely a URL, `False` if not.
     """
-    # Quick and dirty for now.
-    url = URL(candidate)
-    return url.is_absolute_url and url.scheme in ("http", "https")
+    return _LIKELY_URL.match(candidate) is not None
@@ -113,37 +113,43 @@ class Navigation(Vertical, can_focus=False, can_focus_children=True):
         """The history widget."""
         return self._history
 
-    def jump_to_local_files(self, target: Path | None = None) -> Self:
-        """Switch to and focus the local files pane.
+    def _jump_to(self, pane: NavigationPane, toggle: bool = True) -> Self:
+        """Switch to and focus the given pane.
+
+        Args:
+            pane: The pane to jump to.
+            toggle: Should jumping to an already-showing pane close it?
 
         Returns:
             Self.
         """
-        if (
-            self.popped_out
-            and target is None
-            and self.query_one(Tabs).active == self._local_files.id
-        ):
+        if toggle and self.popped_out and self._tabs.active == pane.id:
             self.popped_out = False
         else:
             self.popped_out = True
-            if target is not None:
-                self._local_files.chdir(target)
-            self._local_files.activate().set_focus_within()
+            pane.activate().set_focus_within()
         return self
 
+    def jump_to_local_files(self, target: Path | None = None) -> Self:
+        """Switch to and focus the local files pane.
+
+        Args:
+            target: The optional directory to show in the pane.
+
+        Returns:
+            Self.
+        """
+        if target is not None:
+            self._local_files.chdir(target)
+        return self._jump_to(self._local_files, toggle=target is None)
+
     def jump_to_bookmarks(self) -> Self:
         """Switch to and focus the bookmarks pane.
 
         Returns:
             Self.
         """
-        if self.popped_out and self.query_one(Tabs).active == self._bookmarks.id:
-            self.popped_out = False
-        else:
-            self.popped_out = True
-            self._bookmarks.activate().set_focus_within()
-        return self
+        return self._jump_to(self._bookmarks)
 
     def jump_to_history(self) -> Self:
         """Switch to and focus the history pane.
@@ -151,12 +157,7 @@ class Navigation(Vertical, can_focus=False, can_focus_children=True):
         Returns:
             Self.
         """
-        if self.popped_out and self.query_one(Tabs).active == self._history.id:
-            self.popped_out = False
-        else:
-            self.popped_out = True
-            self._history.activate().set_focus_within()
-        return self
+        return self._jump_to(self._history)
 
     def jump_to_contents(self) -> Self:
         """Switch to and focus the table of contents pane.
@@ -164,22 +165,19 @@ class Navigation(Vertical, can_focus=False, can_focus_children=True):
         Returns:
             Self.
         """
-        if self.popped_out and self.query_one(Tabs).active == self._contents.id:
-            self.popped_out = False
-        else:
-            self.popped_out = True
-            self._contents.activate().set_focus_within()
-        return self
+        return self._jump_to(self._contents)
 
     def action_previous_tab(self) -> None:
         """Switch to the previous tab in the navigation pane."""
         self.query_one(Tabs).action_previous_tab()
-        self.focus_tab()
+        # The tabbed content only learns which tab is active once its tabs
+        # tell it, so focusing has to wait until it has caught up.
+        self.call_after_refresh(self.focus_tab)
 
     def action_next_tab(self) -> None:
         """Switch to the next tab in the navigation pane."""
         self.query_one(Tabs).action_next_tab()
-        self.focus_tab()
+        self.call_after_refresh(self.focus_tab)
 
     def action_toggle_dock(self) -> None:
         """Toggle the dock side for the navigation."""
@@ -190,7 +188,7 @@ class Navigation(Vertical, can_focus=False, can_focus_children=True):
 
     def focus_tab(self) -> None:
         """Focus the currently active tab."""
-        if active := self.query_one(Tabs).active:
+        if active := self._tabs.active:
             self.query_one(
                 f"NavigationPane#{active}", NavigationPane
             ).set_focus_within()
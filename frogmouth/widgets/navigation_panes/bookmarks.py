@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
-from functools import partial
+from asyncio import get_running_loop
+from functools import lru_cache, partial
+from operator import attrgetter
 from pathlib import Path
 
 from httpx import URL
 from rich.text import Text
+from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.message import Message
 from textual.widgets import OptionList
 from textual.widgets.option_list import Option
+from typing_extensions import Final
 
 from ...data import Bookmark, load_bookmarks, save_bookmarks
 from ...dialogs import InputDialog, YesNoDialog
+from ...utility import DeferredSave
 from .navigation_pane import NavigationPane
 
 
@@ -27,6 +32,7 @@ class Entry(Option):
         """The bookmark that this entry relates to."""
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _as_prompt(bookmark: Bookmark) -> Text:
         """Depict the bookmark as a decorated prompt.
 
@@ -35,10 +41,16 @@ class Entry(Option):
 
         Returns:
             A prompt with icon, etc.
+
+        Note:
+            Prompts are cached by bookmark, so a renamed bookmark gets a new
+            prompt.
         """
-        return Text.from_markup(
-            f":{'page_facing_up' if isinstance(bookmark.location, Path) else 'globe_with_meridians'}: "
-            f"[bold]{bookmark.title}[/]\n[dim]{bookmark.location}[/]",
+        return Text.assemble(
+            "📄 " if isinstance(bookmark.location, Path) else "🌐 ",
+            (bookmark.title, "bold"),
+            "\n",
+            (str(bookmark.location), "dim"),
             overflow="ellipsis",
         )
 
@@ -69,19 +81,59 @@ class Bookmarks(NavigationPane):
     ]
     """The bindings for the bookmarks navigation pane."""
 
+    SAVE_DELAY: Final[float] = 0.5
+    """How long to wait for the bookmarks to settle before saving them, in seconds."""
+
     def __init__(self) -> None:
         """Initialise the bookmarks navigation pane."""
         super().__init__("Bookmarks")
-        self._bookmarks: list[Bookmark] = load_bookmarks()
+        self._bookmarks: list[Bookmark] = []
         """The internal list of bookmarks."""
+        self._loaded = False
+        """Have the saved bookmarks been loaded yet?"""
+        self._saver: DeferredSave[list[Bookmark]] = DeferredSave(
+            self, save_bookmarks, self.SAVE_DELAY
+        )
+        """Saves the bookmarks once they have settled down."""
 
     def compose(self) -> ComposeResult:
         """Compose the child widgets."""
-        yield OptionList(*[Entry(bookmark) for bookmark in self._bookmarks])
+        # pylint:disable=attribute-defined-outside-init
+        self._options = OptionList()
+        yield self._options
+
+    def on_mount(self) -> None:
+        """Start loading the bookmarks once the DOM is ready."""
+        self._load_bookmarks()
+
+    @work(exclusive=True)
+    async def _load_bookmarks(self) -> None:
+        """Load the saved bookmarks in the background."""
+        bookmarks = await get_running_loop().run_in_executor(None, load_bookmarks)
+        # The saved bookmarks should already be in order, but renames (or
+        # hand-editing) can upset that; so get them in order here and the
+        # list can be kept that way from then on.
+        self._bookmarks_loaded(sorted(bookmarks, key=attrgetter("title")))
+
+    def _bookmarks_loaded(self, bookmarks: list[Bookmark]) -> None:
+        """Show the bookmarks once they have been loaded.
+
+        Args:
+            bookmarks: The bookmarks that were loaded.
+        """
+        added, self._bookmarks, self._loaded = self._bookmarks, bookmarks, True
+        if added:
+            # Bookmarks were added before the saved ones turned up, so fold
+            # them in and save the lot.
+            self._bookmarks.extend(added)
+            self._bookmarks.sort(key=attrgetter("title"))
+            self._bookmarks_updated()
+        else:
+            self._options.add_options([Entry(bookmark) for bookmark in self._bookmarks])
 
     def set_focus_within(self) -> None:
         """Focus the option list."""
-        self.query_one(OptionList).focus(scroll_visible=False)
+        self._options.focus(scroll_visible=False)
 
     def _bookmarks_updated(self) -> None:
         """Handle the bookmarks being updated."""
@@ -89,14 +141,21 @@ class Bookmarks(NavigationPane):
         # this; and really it's not going to be that frequent. Here we nuke
         # the content of the OptionList and rebuild it based on the actual
         # list of bookmarks.
-        bookmarks = self.query_one(OptionList)
+        bookmarks = self._options
         old_position = bookmarks.highlighted
-        bookmarks.clear_options()
-        for bookmark in self._bookmarks:
-            bookmarks.add_option(Entry(bookmark))
-        save_bookmarks(self._bookmarks)
+        bookmarks.clear_options().add_options(
+            [Entry(bookmark) for bookmark in self._bookmarks]
+        )
+        # Don't save until the saved bookmarks are in, or they'd be lost.
+        if self._loaded:
+            self._saver.update(list(self._bookmarks))
         bookmarks.highlighted = old_position
 
+    def on_unmount(self) -> None:
+        """Tidy up when the bookmarks pane is removed."""
+        # Make sure we don't lose any changes that are waiting to be saved.
+        self._saver.flush()
+
     def add_bookmark(self, title: str, location: Path | URL) -> None:
         """Add a new bookmark.
 
@@ -104,8 +163,11 @@ class Bookmarks(NavigationPane):
             title: The title of the bookmark.
             location: The location of the bookmark.
         """
+        # The list is already in order (give or take any renames), so
+        # sorting it in place with the new bookmark on the end only has to
+        # merge one entry in.
         self._bookmarks.append(Bookmark(title, location))
-        self._bookmarks = sorted(self._bookmarks, key=lambda bookmark: bookmark.title)
+        self._bookmarks.sort(key=attrgetter("title"))
         self._bookmarks_updated()
 
     class Goto(Message):
@@ -143,7 +205,7 @@ class Bookmarks(NavigationPane):
 
     def action_delete(self) -> None:
         """Delete the highlighted bookmark."""
-        if (bookmark := self.query_one(OptionList).highlighted) is not None:
+        if (bookmark := self._options.highlighted) is not None:
             self.app.push_screen(
                 YesNoDialog(
                     "Delete bookmark",
@@ -166,7 +228,7 @@ class Bookmarks(NavigationPane):
 
     def action_rename(self) -> None:
         """Rename the highlighted bookmark."""
-        if (bookmark := self.query_one(OptionList).highlighted) is not None:
+        if (bookmark := self._options.highlighted) is not None:
             self.app.push_screen(
                 InputDialog(
                     "Bookmark title:",
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from functools import partial
-from pathlib import Path
+from functools import lru_cache, partial
+from pathlib import Path, PurePosixPath
 
 from httpx import URL
 from rich.text import Text
@@ -34,6 +34,7 @@ class Entry(Option):
         """The location for his entry in the history."""
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _as_prompt(location: Path | URL) -> Text:
         """Depict the location as a decorated prompt.
 
@@ -42,15 +43,25 @@ class Entry(Option):
 
         Returns:
             A prompt with icon, etc.
+
+        Note:
+            `update_from` makes a new entry for every location each time the
+            history changes, so this is cached.
         """
         if isinstance(location, Path):
-            return Text.from_markup(
-                f":page_facing_up: [bold]{location.name}[/]\n[dim]{location.parent}[/]",
+            return Text.assemble(
+                "📄 ",
+                (location.name, "bold"),
+                "\n",
+                (str(location.parent), "dim"),
                 overflow="ellipsis",
             )
-        return Text.from_markup(
-            f":globe_with_meridians: [bold]{Path(location.path).name}[/]"
-            f"\n[dim]{Path(location.path).parent}\n{location.host}[/]",
+        path = PurePosixPath(location.path)
+        return Text.assemble(
+            "🌐 ",
+            (path.name, "bold"),
+            "\n",
+            (f"{path.parent}\n{location.host}", "dim"),
             overflow="ellipsis",
         )
 
@@ -86,11 +97,13 @@ class History(NavigationPane):
 
     def compose(self) -> ComposeResult:
         """Compose the child widgets."""
-        yield OptionList()
+        # pylint:disable=attribute-defined-outside-init
+        self._options = OptionList()
+        yield self._options
 
     def set_focus_within(self) -> None:
         """Focus the option list."""
-        self.query_one(OptionList).focus(scroll_visible=False)
+        self._options.focus(scroll_visible=False)
 
     def update_from(self, locations: list[Path | URL]) -> None:
         """Update the history from the given list of locations.
@@ -101,9 +114,12 @@ class History(NavigationPane):
         This call removes any existing history and sets it to the given
         value.
         """
-        option_list = self.query_one(OptionList).clear_options()
-        for history_id, location in reversed(list(enumerate(locations))):
-            option_list.add_option(Entry(history_id, location))
+        self._options.clear_options().add_options(
+            [
+                Entry(history_id, location)
+                for history_id, location in reversed(list(enumerate(locations)))
+            ]
+        )
 
     class Goto(Message):
         """Message that requests the viewer goes to a given location."""
@@ -153,7 +169,7 @@ class History(NavigationPane):
 
     def action_delete(self) -> None:
         """Delete the highlighted item from history."""
-        history = self.query_one(OptionList)
+        history = self._options
         if (item := history.highlighted) is not None:
             assert isinstance(entry := history.get_option_at_index(item), Entry)
             self.app.push_screen(
@@ -6,7 +6,6 @@ from pathlib import Path
 from typing import Iterable
 
 from httpx import URL
-from textual.app import ComposeResult
 from textual.message import Message
 from textual.widgets import DirectoryTree
 
@@ -64,10 +63,30 @@ class LocalFiles(NavigationPane):
     def __init__(self) -> None:
         """Initialise the local files navigation pane."""
         super().__init__("Local")
+        self._tree: FilteredDirectoryTree | None = None
+        """The directory tree, once it has been created."""
 
-    def compose(self) -> ComposeResult:
-        """Compose the child widgets."""
-        yield FilteredDirectoryTree(Path("~").expanduser())
+    def _directory_tree(self, path: Path | None = None) -> FilteredDirectoryTree:
+        """Get the directory tree, creating it if it doesn't exist yet.
+
+        Args:
+            path: The path to show in the tree if it needs to be created.
+
+        Returns:
+            The directory tree.
+
+        Note:
+            Creating the directory tree means scanning the filesystem, so
+            it's put off until the pane is actually needed.
+        """
+        if self._tree is None:
+            self._tree = FilteredDirectoryTree(path or Path("~").expanduser())
+            self.mount(self._tree)
+        return self._tree
+
+    def on_show(self) -> None:
+        """Make sure the directory tree is there when the pane is shown."""
+        self._directory_tree()
 
     def chdir(self, path: Path) -> None:
         """Change the filesystem view to the given directory.
@@ -75,11 +94,14 @@ class LocalFiles(NavigationPane):
         Args:
             path: The path to change to.
         """
-        self.query_one(FilteredDirectoryTree).path = path
+        if self._tree is None:
+            self._directory_tree(path)
+        else:
+            self._tree.path = path
 
     def set_focus_within(self) -> None:
         """Focus the directory tree.."""
-        self.query_one(DirectoryTree).focus(scroll_visible=False)
+        self._directory_tree().focus(scroll_visible=False)
 
     class Goto(Message):
         """Message that requests the viewer goes to a given location."""
@@ -103,4 +125,4 @@ class LocalFiles(NavigationPane):
             event: The direct tree selection event.
         """
         event.stop()
-        self.post_message(self.Goto(Path(event.path)))
+        self.post_message(self.Goto(event.path))
@@ -38,9 +38,7 @@ class TableOfContents(NavigationPane):
 
     def set_focus_within(self) -> None:
         """Ensure the tree in the table of contents is focused."""
-        self.query_one("MarkdownTableOfContents > Tree", Tree).focus(
-            scroll_visible=False
-        )
+        self._tree.focus(scroll_visible=False)
 
     def compose(self) -> ComposeResult:
         """Compose the child widgets."""
@@ -54,7 +52,14 @@ class TableOfContents(NavigationPane):
         # and documents. So... we make one and ignore it.
         #
         # https://github.com/Textualize/textual/issues/2516
-        yield MarkdownTableOfContents(Markdown())
+        # pylint:disable=attribute-defined-outside-init
+        self._contents = MarkdownTableOfContents(Markdown())
+        yield self._contents
+
+    def on_mount(self) -> None:
+        """Find the tree to focus once the DOM is ready."""
+        # pylint:disable=attribute-defined-outside-init
+        self._tree = self._contents.query_one(Tree)
 
     def on_table_of_contents_updated(
         self, event: Markdown.TableOfContentsUpdated
@@ -64,6 +69,4 @@ class TableOfContents(NavigationPane):
         Args:
             event: The table of content update event to handle.
         """
-        self.query_one(
-            MarkdownTableOfContents
-        ).table_of_contents = event.table_of_contents
+        self._contents.table_of_contents = event.table_of_contents
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from re import compile as compile_regexp
-from typing import Type
+from stat import S_ISDIR, S_ISREG
+from typing import Callable, Type
 from webbrowser import open as open_url
 
 from httpx import URL
+from textual import work
 from textual.message import Message
 from textual.reactive import var
 from textual.widgets import Input
+from textual.worker import get_current_worker
 
 from ..utility import is_likely_url
 from ..utility.advertising import DISCORD, ORGANISATION_NAME, PACKAGE_NAME
@@ -62,17 +66,44 @@ class Omnibox(Input):
     """Command aliases."""
 
     @staticmethod
-    def _split_command(value: str) -> list[str]:
+    def _split_command(value: str) -> tuple[str, str]:
         """Split a value into a command and argument tail.
 
         Args:
             value: The value to split.
 
         Returns:
-            A list of the command and the argument(s).
+            A tuple of the command and the argument(s).
         """
-        command = value.split(None, 1)
-        return [*command, ""] if len(command) == 1 else command
+        # Split on the first run of any whitespace, padding the result out
+        # in case there's no argument (or no command) at all.
+        command, arguments, *_ = [*value.split(None, 1), "", ""]
+        return command, arguments
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _commands(cls) -> dict[str, Callable[[Omnibox, str], None]]:
+        """Get the table of commands the omnibox knows about.
+
+        Returns:
+            The command handlers, keyed by command name and alias.
+
+        Note:
+            The commands are the `command_*` methods of the class, which
+            don't change once it has been created, so the table is only
+            built once.
+        """
+        commands = {
+            name[len("command_") :]: getattr(cls, name)
+            for name in dir(cls)
+            if name.startswith("command_")
+        }
+        commands.update(
+            (alias, commands[command])
+            for alias, command in cls._ALIASES.items()
+            if command in commands
+        )
+        return commands
 
     def _is_command(self, value: str) -> bool:
         """Is the given string a known command?
@@ -83,11 +114,8 @@ class Omnibox(Input):
         Returns:
             `True` if the string is a known command, `False` if not.
         """
-        command, *_ = self._split_command(value)
-        return (
-            getattr(self, f"command_{self._ALIASES.get(command, command)}", None)
-            is not None
-        )
+        command, _ = self._split_command(value)
+        return command in self._commands()
 
     def _execute_command(self, command: str) -> None:
         """Execute the given command.
@@ -96,9 +124,7 @@ class Omnibox(Input):
             command: The comment to execute.
         """
         command, arguments = self._split_command(command)
-        getattr(self, f"command_{self._ALIASES.get(command, command)}")(
-            arguments.strip()
-        )
+        self._commands()[command](self, arguments.strip())
 
     class LocalViewCommand(Message):
         """The local file view command."""
@@ -154,21 +180,57 @@ class Omnibox(Input):
             # It looks like it's an URL of some description so try and load
             # it as such.
             self.post_message(self.RemoteViewCommand(URL(submitted)))
-        elif (path := Path(submitted).expanduser().resolve()).exists():
+        else:
+            # Anything else could be something in the local filesystem, and
+            # looking there could take a moment; so carry on in the
+            # background.
+            self._look_locally(submitted)
+
+        # We'll handle it one way or another, so stop the event.
+        event.stop()
+
+    @work(thread=True, exclusive=True)
+    def _look_locally(self, submitted: str) -> None:
+        """Look for the submitted value in the local filesystem.
+
+        Args:
+            submitted: The value the user submitted.
+
+        Note:
+            This runs in a thread so that a slow filesystem (a network
+            share or a drive that has to spin up, for example) doesn't
+            freeze the application.
+        """
+        path = Path(submitted).expanduser().resolve()
+        # One stat tells us if it exists and, if it does, what it is.
+        try:
+            mode: int | None = path.stat().st_mode
+        except (OSError, ValueError):
+            mode = None
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._looked_locally, submitted, path, mode)
+
+    def _looked_locally(self, submitted: str, path: Path, mode: int | None) -> None:
+        """Finish handling the submitted value once the filesystem has been checked.
+
+        Args:
+            submitted: The value the user submitted.
+            path: The resolved path for the value.
+            mode: The mode of the path, or `None` if it doesn't exist.
+        """
+        if mode is not None:
             # It's a match for something in the local filesystem. Is it...
-            if path.is_file():
+            if S_ISREG(mode):
                 # a file! Try and open it for viewing.
                 self.post_message(self.LocalViewCommand(path))
                 self.value = str(path)
-            elif path.is_dir():
+            elif S_ISDIR(mode):
                 # Nope, it's a directory. Take that to be a request to open
                 # the local file selection navigation pane with the
                 # directory as the root.
                 self.post_message(self.LocalChdirCommand(path))
-            else:
-                # It's something that exists in the filesystem, but it's not
-                # a directory or a file. Let's nope on that for now.
-                return
+            # Otherwise it's something that exists in the filesystem, but
+            # it's not a directory or a file. Let's nope on that for now.
         elif self._is_command(command := submitted.lower()):
             # Having checked for URLs and existing filesystem things, it's
             # now safe to look for commands. Having got here, it is a match
@@ -185,9 +247,6 @@ class Omnibox(Input):
             # place.
             self.value = submitted
 
-        # If we got a match above stop the event.
-        event.stop()
-
     class ContentsCommand(Message):
         """The table of contents command."""
 
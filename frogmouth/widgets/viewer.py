@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from asyncio import get_running_loop
 from collections import deque
+from functools import partial
 from pathlib import Path
 from typing import Callable
 from webbrowser import open as open_url
 
-from httpx import URL, AsyncClient, HTTPStatusError, RequestError
+from httpx import URL, AsyncClient, Headers, HTTPStatusError, RequestError
 from markdown_it import MarkdownIt
 from mdit_py_plugins import front_matter
 from textual import work
@@ -16,6 +18,7 @@ from textual.binding import Binding
 from textual.containers import VerticalScroll
 from textual.message import Message
 from textual.reactive import var
+from textual.widget import Widget
 from textual.widgets import Markdown
 from typing_extensions import Final
 
@@ -63,14 +66,26 @@ class History:
         """The locations in the history."""
         return list(self._history)
 
-    def remember(self, location: Path | URL) -> None:
+    def remember(self, location: Path | URL) -> bool:
         """Remember a new location in the history.
 
         Args:
             location: The location to remember.
+
+        Returns:
+            `True` if the history changed, `False` if not.
+
+        Note:
+            If the location is the same as the most recent location in the
+            history it isn't added again; instead the history moves on to
+            that location.
         """
+        if self._history and self._history[-1] == location:
+            self._current = len(self._history) - 1
+            return False
         self._history.append(location)
         self._current = len(self._history) - 1
+        return True
 
     def back(self) -> bool:
         """Go back in the history.
@@ -117,6 +132,9 @@ class Viewer(VerticalScroll, can_focus=True, can_focus_children=True):
     ]
     """Bindings for the Markdown viewer widget."""
 
+    MAXIMUM_REMOTE_CACHE: Final[int] = 32
+    """The maximum number of remote documents we'll keep for revalidation."""
+
     history: var[History] = var(History)
     """The browsing history."""
 
@@ -139,22 +157,83 @@ class Viewer(VerticalScroll, can_focus=True, can_focus_children=True):
     class LocationChanged(ViewerMessage):
         """Message sent when the viewer location changes."""
 
+        def __init__(self, viewer: Viewer, history_updated: bool = False) -> None:
+            """Initialise the message.
+
+            Args:
+                viewer: The viewer sending the message.
+                history_updated: Was the history updated by the change?
+            """
+            super().__init__(viewer)
+            self.history_updated: bool = history_updated
+            """Was the history updated as part of the change of location?"""
+
     class HistoryUpdated(ViewerMessage):
         """Message sent when the history is updated."""
 
+    def __init__(
+        self,
+        *children: Widget,
+        name: str | None = None,
+        id: str | None = None,  # pylint:disable=redefined-builtin
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Initialise the viewer.
+
+        Args:
+            children: The child widgets.
+            name: The name of the viewer.
+            id: The ID of the viewer in the DOM.
+            classes: The CSS classes of the viewer.
+            disabled: Whether the viewer is disabled or not.
+        """
+        super().__init__(
+            *children, name=name, id=id, classes=classes, disabled=disabled
+        )
+        self._block_index: dict[str, Widget] = {}
+        """Index of the document's heading blocks, keyed by their ID."""
+        self._client: AsyncClient | None = None
+        """The HTTP client used to load remote documents."""
+        self._remote_cache: dict[str, tuple[dict[str, str], str]] = {}
+        """Validators and content of recent remote documents, keyed by URL."""
+
     def compose(self) -> ComposeResult:
         """Compose the markdown viewer."""
-        yield Markdown(
+        # pylint:disable=attribute-defined-outside-init
+        self._document = Markdown(
             PLACEHOLDER,
             parser_factory=lambda: MarkdownIt("gfm-like").use(
                 front_matter.front_matter_plugin
             ),
         )
+        yield self._document
+
+    async def on_unmount(self) -> None:
+        """Clean up once the viewer has been removed from the DOM."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> AsyncClient:
+        """The HTTP client to use when loading remote documents.
+
+        Note:
+            The client is created on first use and is then reused for the
+            lifetime of the viewer, so that connections can be kept alive
+            between remote loads.
+        """
+        if self._client is None:
+            self._client = AsyncClient(
+                follow_redirects=True, headers={"user-agent": USER_AGENT}
+            )
+        return self._client
 
     @property
     def document(self) -> Markdown:
         """The markdown document."""
-        return self.query_one(Markdown)
+        return self._document
 
     @property
     def location(self) -> Path | URL | None:
@@ -167,7 +246,18 @@ class Viewer(VerticalScroll, can_focus=True, can_focus_children=True):
         Args:
             block_id: The ID of the block to scroll to.
         """
-        self.scroll_to_widget(self.document.query_one(f"#{block_id}"), top=True)
+        # The index of headings is built on demand, and rebuilt if it looks
+        # like it's gone stale because the document has changed.
+        block = self._block_index.get(block_id)
+        if block is None or not block.is_attached:
+            self._block_index = {
+                heading.id: heading
+                for heading in self.document.query("MarkdownHeader").results()
+                if heading.id is not None
+            }
+            block = self._block_index.get(block_id)
+        if block is not None:
+            self.scroll_to_widget(block, top=True)
 
     def _post_load(self, location: Path | URL, remember: bool = True) -> None:
         """Perform some post-load tasks.
@@ -178,14 +268,15 @@ class Viewer(VerticalScroll, can_focus=True, can_focus_children=True):
         """
         # We've loaded something fresh, ensure we're at the top.
         self.scroll_home(animate=False)
+        # Any index of the headings is now out of date.
+        self._block_index = {}
         # If we've made it in here we are viewing an actual location.
         self.viewing_location = True
-        # Remember the location in the history if we're supposed to.
-        if remember:
-            self.history.remember(location)
-            self.post_message(self.HistoryUpdated(self))
-        # Let anyone else know we've changed location.
-        self.post_message(self.LocationChanged(self))
+        # Let anyone else know we've changed location, and if we remembered
+        # it in the history, that the history has changed too.
+        self.post_message(
+            self.LocationChanged(self, remember and self.history.remember(location))
+        )
 
     @work(exclusive=True)
     async def _local_load(self, location: Path, remember: bool = True) -> None:
@@ -194,9 +285,16 @@ class Viewer(VerticalScroll, can_focus=True, can_focus_children=True):
         Args:
             location: The location to load from.
             remember: Should we remember the location in th ehistory?
+
+        Note:
+            The file is read in a background thread so that the UI carries
+            on updating while we wait on storage.
         """
+        path, anchor = self.document.sanitize_location(str(location))
         try:
-            await self.document.load(location)
+            content = await get_running_loop().run_in_executor(
+                None, partial(path.read_text, encoding="utf-8")
+            )
         except OSError as error:
             self.app.push_screen(
                 ErrorDialog(
@@ -205,6 +303,9 @@ class Viewer(VerticalScroll, can_focus=True, can_focus_children=True):
                 )
             )
         else:
+            await self.document.update(content)
+            if anchor:
+                self.document.goto_anchor(anchor)
             self._post_load(location, remember)
 
     @work(exclusive=True)
@@ -216,43 +317,81 @@ class Viewer(VerticalScroll, can_focus=True, can_focus_children=True):
             remember: Should we remember the location in the history?
         """
 
+        # If we've seen this document before, and the server gave us
+        # something we can validate it with, ask for it only if it has
+        # changed since.
+        validators, cached = self._remote_cache.get(str(location), ({}, ""))
+
         try:
-            async with AsyncClient() as client:
-                response = await client.get(
-                    location,
-                    follow_redirects=True,
-                    headers={"user-agent": USER_AGENT},
-                )
+            async with self.client.stream(
+                "GET", location, headers=validators
+            ) as response:
+                if response.status_code == 304:
+                    self.document.update(cached)
+                    self._post_load(location, remember)
+                    return
+                try:
+                    response.raise_for_status()
+                except HTTPStatusError as error:
+                    self.app.push_screen(
+                        ErrorDialog("Error getting document", str(error))
+                    )
+                    return
+
+                # There didn't seem to be an error transporting the data, and
+                # neither did there seem to be an error with the resource
+                # itself. However... it's possible we've been fooled into
+                # loading up something that looked like it was a markdown
+                # file, but really it's a web-rendering of such a file; so
+                # as a final check we make sure we're looking at something
+                # that's plain text, or actually Markdown. Because we're
+                # streaming the response, this happens before we've pulled
+                # down the body.
+                content_type = response.headers.get("content-type", "")
+                if not any(
+                    content_type.startswith(f"text/{sub_type}")
+                    for sub_type in ("plain", "markdown", "x-markdown")
+                ):
+                    # Didn't look like something we could handle with the
+                    # Markdown viewer. We could throw up an error, or we
+                    # could just be nice to the user. Let's be nice...
+                    open_url(str(location))
+                    return
+
+                # Pull the body down, decoding it as it arrives, so that we
+                # never need to hold on to the raw bytes as well as the text.
+                content = "".join([text async for text in response.aiter_text()])
+                self._remember_remote(location, response.headers, content)
         except RequestError as error:
             self.app.push_screen(ErrorDialog("Error getting document", str(error)))
             return
 
-        try:
-            response.raise_for_status()
-        except HTTPStatusError as error:
-            self.app.push_screen(ErrorDialog("Error getting document", str(error)))
-            return
+        self.document.update(content)
+        self._post_load(location, remember)
 
-        # There didn't seem to be an error transporting the data, and
-        # neither did there seem to be an error with the resource itself. So
-        # at this point we should hopefully have the document's content.
-        # However... it's possible we've been fooled into loading up
-        # something that looked like it was a markdown file, but really it's
-        # a web-rendering of such a file; so as a final check we make sure
-        # we're looking at something that's plain text, or actually
-        # Markdown.
-        content_type = response.headers.get("content-type", "")
-        if any(
-            content_type.startswith(f"text/{sub_type}")
-            for sub_type in ("plain", "markdown", "x-markdown")
-        ):
-            self.document.update(response.text)
-            self._post_load(location, remember)
-        else:
-            # Didn't look like something we could handle with the Markdown
-            # viewer. We could throw up an error, or we could just be nice
-            # to the user. Let's be nice...
-            open_url(str(location))
+    def _remember_remote(self, location: URL, headers: Headers, content: str) -> None:
+        """Remember a remote document so that later loads can be conditional.
+
+        Args:
+            location: The location of the document.
+            headers: The headers the document was served with.
+            content: The content of the document.
+        """
+        key = str(location)
+        self._remote_cache.pop(key, None)
+        validators = {
+            request_header: headers[response_header]
+            for response_header, request_header in (
+                ("etag", "if-none-match"),
+                ("last-modified", "if-modified-since"),
+            )
+            if response_header in headers
+        }
+        if not validators:
+            return
+        if len(self._remote_cache) >= self.MAXIMUM_REMOTE_CACHE:
+            del self._remote_cache[next(iter(self._remote_cache))]
+        self._remote_cache[key] = (validators, content)
 
     def visit(self, location: Path | URL, remember: bool = True) -> None:
         """Visit a location.
@@ -281,6 +420,7 @@ class Viewer(VerticalScroll, can_focus=True, can_focus_children=True):
             content: The text to show.
         """
         self.viewing_location = False
+        self._block_index = {}
         self.document.update(content)
         self.scroll_home(animate=False)
 